@@ -3,4 +3,4 @@ from mcp_server.prompt_templates.travel import get_itinerary_prompt
 
 @mcp.prompt()
 async def generate_itinerary_prompt(days: int, start_date: str) -> str:
-    return await get_itinerary_prompt(days, start_date)
+    return get_itinerary_prompt(days, start_date)
@@ -10,19 +10,25 @@ import os
 
 load_dotenv()
 
+# Resolved once at import; the provider does not change at runtime
+AUTH_PROVIDER = os.environ.get("AUTH_PROVIDER", "github")
+
+# Build the auth checker once at module scope instead of inside the
+# decorator call, so the permission set is only constructed on import.
+require_get_user_info = require_permissions("tool:get_user_info")
+
 @mcp.tool(
     name="get_user_info",
     description="Return auth user info",
-    auth=require_permissions("tool:get_user_info")
+    auth=require_get_user_info
 )
 async def get_user_info() -> dict:
     """Returns information about the authenticated GitHub user."""
     
     token = get_access_token()
     output = {}
-    auth_provider = os.environ.get("AUTH_PROVIDER", "github")
-    
-    if auth_provider == "auth0":
+
+    if AUTH_PROVIDER == "auth0":
         output = {
             "issuer": token.claims.get("iss"),
             "audience": token.claims.get("aud"),
@@ -30,7 +36,7 @@ async def get_user_info() -> dict:
             "permissions": token.claims.get("permissions"),
             "user_info": get_auth0_user_info(token.token)
         }
-    elif auth_provider == "github":
+    elif AUTH_PROVIDER == "github":
         output = {
             "github_user": token.claims.get("login"),
             "name": token.claims.get("name"),
@@ -45,8 +51,7 @@ async def get_user_info() -> dict:
 )
 async def custom_auth_tool() -> dict:
     """Custom auth tool"""
-    token = get_access_token()
-    print(token)
+    get_access_token()
     return {
         "message": "Custom auth tool"
     }
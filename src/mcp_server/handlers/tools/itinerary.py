@@ -38,4 +38,4 @@ async def get_activity_suggestions(
     Returns:
         list[str]: List of suggested activities
     """
-    return await s_get_activity_suggestions(params.temperature, params.time_of_day)
+    return s_get_activity_suggestions(params.temperature, params.time_of_day)
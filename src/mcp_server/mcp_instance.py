@@ -1,24 +1,36 @@
 import os
+from functools import lru_cache
+
 from fastmcp import FastMCP
 from mcp_server.config.auth_provider import get_auth_provider
 from dotenv import load_dotenv
 
 
-load_dotenv()
+@lru_cache(maxsize=None)
+def create_mcp() -> FastMCP:
+    """
+    Build the FastMCP instance, loading environment configuration once.
+
+    dotenv loading and env parsing happen here instead of as scattered
+    module-level statements, so the work runs exactly once no matter how
+    often the module is imported or the factory is called.
+    """
+    load_dotenv()
 
-is_auth_enabled = os.environ.get("AUTH_ENABLED", "").lower() in ("true", "1")
+    is_auth_enabled = os.environ.get("AUTH_ENABLED", "").lower() in ("true", "1")
 
-# Configuration for MCP initialization
-mcp_config_context = {
-    "name": "Cox's Bazar AI Itinerary MCP",
-}
+    # Configuration for MCP initialization
+    mcp_config_context = {
+        "name": "Cox's Bazar AI Itinerary MCP",
+    }
 
-# Add auth if auth is enabled
-if is_auth_enabled:
-    auth_provider = os.environ.get("AUTH_PROVIDER", "github")
-    mcp_config_context["auth"] = get_auth_provider(auth_provider)
+    # Add auth if auth is enabled
+    if is_auth_enabled:
+        auth_provider = os.environ.get("AUTH_PROVIDER", "github")
+        mcp_config_context["auth"] = get_auth_provider(auth_provider)
 
+    # Initialize FastMCP with valid parameters only
+    return FastMCP(**mcp_config_context, strict_input_validation=True)
 
-# Initialize FastMCP with valid parameters only
-mcp = FastMCP(**mcp_config_context, strict_input_validation=True)
 
+mcp = create_mcp()
@@ -1,9 +1,15 @@
 """Pydantic models for itinerary tools."""
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared config: instances are read-only snapshots of client input, and
+# unknown fields are rejected instead of silently dropped. Frozen models
+# are also hashable and skip the mutability bookkeeping on creation.
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 class ItineraryPreferences(BaseModel):
     """Schema for collecting user itinerary preferences."""
+    model_config = _MODEL_CONFIG
+
     extendTrip: bool = Field(
         description="Would you like to extend your trip to the recommended minimum of 2 days?"
     )
@@ -14,6 +20,8 @@ class ItineraryPreferences(BaseModel):
 
 class GenerateItinerarySchema(BaseModel):
     """Schema for generating an itinerary."""
+    model_config = _MODEL_CONFIG
+
     start_date: str = Field(
         description="Start date of the trip",
         default="2026-01-24"
@@ -25,6 +33,8 @@ class GenerateItinerarySchema(BaseModel):
 
 class GetActivitySuggestionsSchema(BaseModel):
     """Schema for getting activity suggestions."""
+    model_config = _MODEL_CONFIG
+
     temperature: float = Field(
         description="Temperature in Celsius",
         default=28
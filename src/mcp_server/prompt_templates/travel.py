@@ -1,18 +1,8 @@
 from typing import Dict, Any
 
-async def get_itinerary_prompt(days: int, start_date: str) -> str:
-    """
-    Full workflow: fetch daily temperatures + generate AI itinerary.
-    Uses the registered MCP prompt 'generate_itinerary' for consistency.
-    
-    Args:
-        days: Number of days for the trip
-        start_date: Start date (e.g., "2025-01-15", "15 Jan 2025", "today")
-    
-    Returns:
-        Formatted prompt for AI to generate detailed itinerary
-    """
-    return f"""Generate a detailed {days}-day itinerary for Cox's Bazar, Bangladesh starting from {start_date}.
+# Prompt bodies are built once at module load; the functions below only
+# fill in the per-request values.
+_ITINERARY_PROMPT_TEMPLATE = """Generate a detailed {days}-day itinerary for Cox's Bazar, Bangladesh starting from {start_date}.
 
 Consider the following in your itinerary:
 
@@ -55,32 +45,59 @@ Consider the following in your itinerary:
 
 Please create a day-by-day itinerary with specific timings, activities, and practical tips."""
 
+_WEATHER_PROMPT_HEADER = """Based on the weather forecast for Cox's Bazar, suggest optimal activities for each day:
 
-async def get_weather_based_activities_prompt(weather_data: Dict[str, Any]) -> str:
+Location: {location}
+Trip Duration: {days} days
+Start Date: {start_date}
+
+Daily Weather Summary:
+"""
+
+_WEATHER_PROMPT_FOOTER = """
+Based on this weather forecast, please provide:
+1. Best activities for each day considering the weather conditions
+2. Time-specific recommendations (morning/afternoon/evening)
+3. Indoor alternatives for rainy or very hot days
+4. Optimal times for beach activities
+5. Photography opportunities (sunrise/sunset)
+6. Dining suggestions based on weather
+"""
+
+
+def get_itinerary_prompt(days: int, start_date: str) -> str:
+    """
+    Full workflow: fetch daily temperatures + generate AI itinerary.
+    Uses the registered MCP prompt 'generate_itinerary' for consistency.
+
+    Args:
+        days: Number of days for the trip
+        start_date: Start date (e.g., "2025-01-15", "15 Jan 2025", "today")
+
+    Returns:
+        Formatted prompt for AI to generate detailed itinerary
+    """
+    return _ITINERARY_PROMPT_TEMPLATE.format(days=days, start_date=start_date)
+
+
+def get_weather_based_activities_prompt(weather_data: Dict[str, Any]) -> str:
     """
     Generate activity suggestions based on weather forecast.
-    
+
     Args:
         weather_data: Weather forecast data
-    
+
     Returns:
         Formatted prompt with weather-based activity suggestions
     """
     forecast = weather_data.get("forecast", [])
-    
-    location = weather_data.get('location', 'Cox\'s Bazar')
-    days = weather_data.get('days', 0)
-    start_date = weather_data.get('start_date', 'N/A')
-    
-    prompt = f"""Based on the weather forecast for Cox's Bazar, suggest optimal activities for each day:
 
-Location: {location}
-Trip Duration: {days} days
-Start Date: {start_date}
+    parts = [_WEATHER_PROMPT_HEADER.format(
+        location=weather_data.get('location', 'Cox\'s Bazar'),
+        days=weather_data.get('days', 0),
+        start_date=weather_data.get('start_date', 'N/A'),
+    )]
 
-Daily Weather Summary:
-"""
-    
     for day in forecast:
         day_num = day.get('day', 0)
         date = day.get('date', 'N/A')
@@ -92,22 +109,14 @@ Daily Weather Summary:
         windspeed = day.get('windspeed', 0)
         sunrise = day.get('sunrise', 'N/A')
         sunset = day.get('sunset', 'N/A')
-        
-        prompt += f"\nDay {day_num} ({date}):\n"
-        prompt += f"- Weather: {weather}\n"
-        prompt += f"- Temperature: {temp_min}°C - {temp_max}°C (Avg: {temp_avg}°C)\n"
-        prompt += f"- Precipitation: {precipitation}mm\n"
-        prompt += f"- Wind Speed: {windspeed} km/h\n"
-        prompt += f"- Sunrise: {sunrise} | Sunset: {sunset}\n"
-    
-    prompt += """
-Based on this weather forecast, please provide:
-1. Best activities for each day considering the weather conditions
-2. Time-specific recommendations (morning/afternoon/evening)
-3. Indoor alternatives for rainy or very hot days
-4. Optimal times for beach activities
-5. Photography opportunities (sunrise/sunset)
-6. Dining suggestions based on weather
-"""
-    
-    return prompt
\ No newline at end of file
+
+        parts.append(f"\nDay {day_num} ({date}):\n")
+        parts.append(f"- Weather: {weather}\n")
+        parts.append(f"- Temperature: {temp_min}°C - {temp_max}°C (Avg: {temp_avg}°C)\n")
+        parts.append(f"- Precipitation: {precipitation}mm\n")
+        parts.append(f"- Wind Speed: {windspeed} km/h\n")
+        parts.append(f"- Sunrise: {sunrise} | Sunset: {sunset}\n")
+
+    parts.append(_WEATHER_PROMPT_FOOTER)
+
+    return "".join(parts)
@@ -1,4 +1,5 @@
 """Main FastMCP server for Cox's Bazar AI Itinerary."""
+import logging
 import sys
 import os
 from pathlib import Path
@@ -19,12 +20,26 @@ from fastmcp.server.middleware.rate_limiting import RateLimitingMiddleware
 #from fastmcp.server.auth import require_auth
 
 
-load_dotenv()
+# Transports that need a host/port to run on
+_HTTP_TRANSPORTS = frozenset({"http", "streamable-http", "sse"})
+
+
+def _get_client_id(ctx) -> str:
+    """Rate-limit key: the MCP session id, or "unknown" without a context."""
+    return ctx.fastmcp_context.session_id if ctx.fastmcp_context else "unknown"
 
 
 def main():
     """Run the MCP server."""
-    transport_name = os.environ.get("TRANSPORT_NAME") or "stdio"
+    load_dotenv()
+
+    # Route server logs through logging (stderr) rather than print;
+    # stdout belongs to the protocol on stdio transport
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL") or "INFO")
+
+    # Normalize once so the HTTP-transport check and mcp.run() see the
+    # same lowercase name regardless of how the env var is cased
+    transport_name = (os.environ.get("TRANSPORT_NAME") or "stdio").lower()
     server_port = int(os.environ.get("SERVER_PORT") or 8000)
     server_host = os.environ.get("SERVER_HOST") or "0.0.0.0"
 
@@ -38,14 +53,14 @@ def main():
     mcp.add_middleware(RateLimitingMiddleware(
         max_requests_per_second=10.0,
         burst_capacity=20,
-        get_client_id=lambda ctx: ctx.fastmcp_context.session_id if ctx.fastmcp_context else "unknown"
+        get_client_id=_get_client_id
     ))
 
     
     # global auth middleware
     #mcp.middleware.append(AuthMiddleware(auth=require_auth))
 
-    if transport_name == "http" or transport_name == "streamable-http" or transport_name == "sse":
+    if transport_name in _HTTP_TRANSPORTS:
         mcp.run(transport=transport_name, port=server_port, host=server_host)
     else:
         mcp.run(transport=transport_name)
@@ -1,38 +1,101 @@
-import json
+from operator import itemgetter
+
 from fastmcp import Context
-from datetime import datetime
-from dateutil import parser
 from mcp_server.prompt_templates.travel import get_itinerary_prompt, get_weather_based_activities_prompt
 from mcp_server.utils.elicitation import elicit_trip_extension
-from mcp_server.utils.get_weather_forecast import get_activity_suggestions as get_suggestions
+from mcp_server.utils.forecast_cache import get_cached_forecast
+from mcp_server.utils.get_weather_forecast import (
+    get_activity_suggestions as get_suggestions,
+    get_daily_activity_suggestions,
+    parse_start_date,
+)
+
+# Minimum recommended trip length before we ask the user to extend
+MIN_TRIP_DAYS = 2
+
+# Extract all day fields in one C-level call instead of repeated lookups
+_day_fields = itemgetter(
+    'day', 'date', 'weather', 'temp_min', 'temp_max', 'temp_avg',
+    'precipitation', 'windspeed', 'sunrise', 'sunset',
+)
+
+
+# Day section compiled once; filled per day with str.format
+_DAY_SECTION_TEMPLATE = """### Day {day} - {date}
+- **Weather:** {weather}
+- **Temperature:** {temp_min}°C - {temp_max}°C (Average: {temp_avg}°C)
+- **Precipitation:** {precipitation}mm
+- **Wind Speed:** {windspeed} km/h
+- **Sunrise:** {sunrise} | **Sunset:** {sunset}
+
+**Activity Suggestions:**
+
+- **Morning:** {morning}
+- **Afternoon:** {afternoon}
+- **Evening:** {evening}
+
+{elicitation_note}
+
+"""
+
+
+def _format_day_section(day: dict, elicitation_note: str) -> str:
+    """Format one forecast day as a markdown section with activity suggestions."""
+    (day_num, date, weather, temp_min, temp_max, temp_avg,
+     precipitation, windspeed, sunrise, sunset) = _day_fields(day)
+
+    morning_activities, afternoon_activities, evening_activities = (
+        get_daily_activity_suggestions(temp_avg)
+    )
+
+    return _DAY_SECTION_TEMPLATE.format(
+        day=day_num,
+        date=date,
+        weather=weather,
+        temp_min=temp_min,
+        temp_max=temp_max,
+        temp_avg=temp_avg,
+        precipitation=precipitation,
+        windspeed=windspeed,
+        sunrise=sunrise,
+        sunset=sunset,
+        morning=', '.join(morning_activities[:2]),
+        afternoon=', '.join(afternoon_activities[:2]),
+        evening=', '.join(evening_activities[:2]),
+        elicitation_note=elicitation_note,
+    )
+
 
 async def s_generate_itinerary(ctx: Context, start_date: str, days: int) -> str:
+
+    # Elicit trip extension only when below the recommended minimum;
+    # trips that already qualify skip the elicitation round-trip entirely.
+    elicitation_note = ""
+    if days < MIN_TRIP_DAYS:
+        try:
+            days, elicitation_note = await elicit_trip_extension(ctx, start_date, days, min_days=MIN_TRIP_DAYS)
+        except ValueError as e:
+            # User cancelled the trip extension
+            await ctx.error(f"Error: {str(e)}")
+            return str(e)
     
-    # Elicit trip extension if needed (minimum 2 days recommended)
-    try:
-        days, elicitation_note = await elicit_trip_extension(ctx, start_date, days, min_days=2)
-    except ValueError as e:
-        # User cancelled the trip extension
-        await ctx.error(f"Error: {str(e)}")
-        return str(e)
-    
-    # Parse start date
-    try:
-        start_date = parser.parse(start_date)
-    except Exception:
-        start_date = datetime.today()
+    # Normalize the start date to ISO once, so the forecast cache keys
+    # directly on it without re-parsing free-form input downstream.
+    start_date = parse_start_date(start_date).strftime("%Y-%m-%d")
 
-    read_weather_forecast = await ctx.read_resource(f"weather://coxsbazar/forecast/{start_date}/{days}")
-    weather_data = json.loads(read_weather_forecast.contents[0].content)
+    # Fetch in-process through the shared cache instead of round-tripping
+    # through the resource handler and a serialize/parse cycle.
+    weather_data = await get_cached_forecast(start_date, days)
 
     # Generate base itinerary prompt
-    base_prompt = await get_itinerary_prompt(days, start_date)
-    
+    base_prompt = get_itinerary_prompt(days, start_date)
+
     # Generate weather-based activities prompt
-    weather_prompt = await get_weather_based_activities_prompt(weather_data)
+    weather_prompt = get_weather_based_activities_prompt(weather_data)
     
-    # Format output
-    output = f"""# Cox's Bazar Itinerary Planning
+    # Format output - collect parts and join once instead of repeated
+    # string concatenation, which reallocates the whole output each time.
+    parts = [f"""# Cox's Bazar Itinerary Planning
 
 ## Trip Details
 - **Location:** {weather_data['location']}
@@ -42,36 +105,13 @@ async def s_generate_itinerary(ctx: Context, start_date: str, days: int) -> str:
 
 ## Weather Forecast
 
-"""
-    
+"""]
+
     # Add detailed forecast
     for day in weather_data['forecast']:
-        output += f"""### Day {day['day']} - {day['date']}
-- **Weather:** {day['weather']}
-- **Temperature:** {day['temp_min']}°C - {day['temp_max']}°C (Average: {day['temp_avg']}°C)
-- **Precipitation:** {day['precipitation']}mm
-- **Wind Speed:** {day['windspeed']} km/h
-- **Sunrise:** {day['sunrise']} | **Sunset:** {day['sunset']}
-
-**Activity Suggestions:**
-"""
-        
-        # Get activity suggestions for different times
-        temp_avg = day['temp_avg']
-        morning_activities = get_suggestions(temp_avg - 2, "morning")
-        afternoon_activities = get_suggestions(temp_avg, "afternoon")
-        evening_activities = get_suggestions(temp_avg, "evening")
-        
-        output += f"""
-- **Morning:** {', '.join(morning_activities[:2])}
-- **Afternoon:** {', '.join(afternoon_activities[:2])}
-- **Evening:** {', '.join(evening_activities[:2])}
+        parts.append(_format_day_section(day, elicitation_note))
 
-{elicitation_note}
-
-"""
-    
-    output += f"""
+    parts.append(f"""
 ---
 
 ## AI Itinerary Generation Prompt
@@ -87,10 +127,12 @@ async def s_generate_itinerary(ctx: Context, start_date: str, days: int) -> str:
 ---
 
 **Note:** Use the above prompts with an AI assistant to generate a detailed, personalized itinerary based on the weather forecast and your preferences.
-"""
-    
-    return output
+""")
+
+    return "".join(parts)
 
-async def s_get_activity_suggestions(temperature: float, time_of_day: str = "afternoon") -> list[str]:
+def s_get_activity_suggestions(temperature: float, time_of_day: str = "afternoon") -> list[str]:
     """ Suggest activities based on temperature and time of day """
-    return get_suggestions(temperature, time_of_day)
\ No newline at end of file
+    # The underlying suggestions are shared tuples; copy to a list at the
+    # tool boundary so callers get the documented mutable type.
+    return list(get_suggestions(temperature, time_of_day))
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""TTL cache for Open-Meteo forecast data shared by resources and tools."""
+import asyncio
+import os
+import time
+from typing import Any, Dict
+
+import orjson
+
+from mcp_server.utils.get_weather_forecast import get_weather_forecast, parse_start_date
+
+# Forecast data changes roughly hourly, so identical (start_date, days)
+# lookups within the TTL are served from memory instead of re-hitting
+# the Open-Meteo API. Override with WEATHER_CACHE_TTL (seconds).
+CACHE_TTL_SECONDS = float(os.environ.get("WEATHER_CACHE_TTL") or 900.0)
+
+# Keys are client-supplied, so the cache is bounded: past this many
+# entries the oldest is evicted on insert (dicts keep insertion order,
+# and entries are only ever inserted fresh, so first = oldest).
+CACHE_MAX_ENTRIES = 256
+
+# Maps (start_date, days) -> (monotonic timestamp, forecast dict, serialized JSON)
+_forecast_cache: dict[tuple[str, int], tuple[float, Dict[str, Any], str]] = {}
+_forecast_cache_lock = asyncio.Lock()
+
+# In-flight fetches keyed like the cache, so concurrent identical requests
+# share one upstream call instead of each hitting the API (singleflight).
+_inflight: dict[tuple[str, int], "asyncio.Future[tuple[Dict[str, Any], str]]"] = {}
+
+
+def normalize_start_date(start_date: str) -> str:
+    """
+    Normalize a start date to ISO format (YYYY-MM-DD) for cache keying.
+
+    Args:
+        start_date: Start date in various formats (e.g., "2025-01-15", "today")
+
+    Returns:
+        ISO formatted date string; defaults to today on unparseable input
+    """
+    return parse_start_date(start_date).strftime("%Y-%m-%d")
+
+
+async def _get_entry(start_date: str, days: int) -> tuple[Dict[str, Any], str]:
+    """Return the cached (dict, JSON) pair for (start_date, days), fetching on miss."""
+    cache_key = (normalize_start_date(start_date), days)
+    now = time.monotonic()
+
+    async with _forecast_cache_lock:
+        cached = _forecast_cache.get(cache_key)
+        if cached is not None:
+            cached_at, weather_data, payload = cached
+            if now - cached_at <= CACHE_TTL_SECONDS:
+                return weather_data, payload
+            # Expired - evict lazily on lookup
+            del _forecast_cache[cache_key]
+
+        inflight = _inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = inflight
+            is_owner = True
+        else:
+            is_owner = False
+
+    if not is_owner:
+        # Another task is already fetching this key - wait for its result
+        return await inflight
+
+    try:
+        weather_data = await get_weather_forecast(start_date, days)
+        payload = orjson.dumps(weather_data).decode()
+        entry = (weather_data, payload)
+        async with _forecast_cache_lock:
+            _forecast_cache[cache_key] = (time.monotonic(), weather_data, payload)
+            while len(_forecast_cache) > CACHE_MAX_ENTRIES:
+                _forecast_cache.pop(next(iter(_forecast_cache)))
+            del _inflight[cache_key]
+        inflight.set_result(entry)
+        return entry
+    except BaseException as exc:
+        async with _forecast_cache_lock:
+            _inflight.pop(cache_key, None)
+        inflight.set_exception(exc)
+        # Waiters get the exception through the future; silence the
+        # "exception never retrieved" warning when there are none.
+        inflight.exception()
+        raise
+
+
+async def get_cached_forecast(start_date: str, days: int) -> Dict[str, Any]:
+    """
+    Get the forecast dict for (start_date, days), serving repeats from cache.
+
+    Args:
+        start_date: Start date (normalized to ISO before keying)
+        days: Number of days (1-16)
+
+    Returns:
+        Weather forecast data as a dictionary
+    """
+    weather_data, _ = await _get_entry(start_date, days)
+    return weather_data
+
+
+async def get_cached_forecast_json(start_date: str, days: int) -> str:
+    """
+    Get the forecast JSON for (start_date, days), serving repeats from cache.
+
+    Args:
+        start_date: Start date (normalized to ISO before keying)
+        days: Number of days (1-16)
+
+    Returns:
+        Weather forecast data as a JSON string
+    """
+    _, payload = await _get_entry(start_date, days)
+    return payload
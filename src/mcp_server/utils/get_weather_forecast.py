@@ -1,63 +1,104 @@
 """Weather forecast utility using Open-Meteo API."""
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import logging
+from datetime import date, datetime, timedelta
+from itertools import islice, zip_longest
+from typing import Dict, Any, Tuple
 from dateutil import parser
 from mcp_server.utils.http import open_meteo_client
 
+logger = logging.getLogger(__name__)
+
 
 # Cox's Bazar coordinates
 COX_BAZAR_LAT = 21.4272
 COX_BAZAR_LON = 92.0058
 
+# Last validator and parsed payload per date range, so revalidation can
+# send If-None-Match and reuse the parsed forecast on a 304 response.
+# Bounded LRU over a plain dict: hits are moved to the end and inserts
+# evict from the front once the cap is reached.
+_CONDITIONAL_CACHE_MAX_ENTRIES = 64
+_conditional_cache: Dict[tuple, tuple] = {}
+
+# Request parameters that never change between calls
+_STATIC_FORECAST_PARAMS = {
+    "latitude": COX_BAZAR_LAT,
+    "longitude": COX_BAZAR_LON,
+    "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode,windspeed_10m_max,sunrise,sunset",
+    "timezone": "Asia/Dhaka",
+}
+
 
-def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
+def parse_start_date(start_date: str) -> datetime:
+    """
+    Parse a start date string, taking the ISO fast path when possible.
+
+    Args:
+        start_date: Start date in various formats (e.g., "2025-01-15", "today")
+
+    Returns:
+        Parsed datetime; defaults to today on unparseable input
+    """
+    if start_date.lower() == "today":
+        return datetime.today()
+    try:
+        return datetime.fromisoformat(start_date)
+    except ValueError:
+        pass
+    try:
+        return parser.parse(start_date)
+    except Exception:
+        return datetime.today()
+
+
+async def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
     """
     Fetch weather forecast from Open-Meteo API for Cox's Bazar.
-    
+
     Args:
         start_date: Start date in various formats (e.g., "2025-01-15", "15 Jan 2025", "today")
         days: Number of days to fetch forecast for (1-16)
-    
+
     Returns:
         Dictionary containing location, start_date, days, and detailed forecast
-    
+
     Raises:
         Exception: If API request fails
     """
-    # Parse start date
-    try:
-        if start_date.lower() == "today":
-            start_dt = datetime.today()
-        else:
-            start_dt = parser.parse(start_date)
-    except Exception:
-        start_dt = datetime.today()
-    
+    # Parse start date (ISO fast path, dateutil fallback)
+    start_dt = parse_start_date(start_date)
+
     # Calculate end date
     end_dt = start_dt + timedelta(days=days - 1)
-    
+
     # Format dates for API (YYYY-MM-DD)
     start_date_str = start_dt.strftime("%Y-%m-%d")
     end_date_str = end_dt.strftime("%Y-%m-%d")
-    
+
     params = {
-        "latitude": COX_BAZAR_LAT,
-        "longitude": COX_BAZAR_LON,
-        "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode,windspeed_10m_max,sunrise,sunset",
-        "timezone": "Asia/Dhaka",
+        **_STATIC_FORECAST_PARAMS,
         "start_date": start_date_str,
         "end_date": end_date_str
     }
     
     try:
-        response = open_meteo_client.get("/v1/forecast", params=params)
+        cache_key = (start_date_str, end_date_str)
+        cached = _conditional_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+        response = await open_meteo_client.get("/v1/forecast", params=params, headers=headers)
+        if cached is not None and response.status_code == 304:
+            # Not modified upstream - reuse the previously parsed forecast
+            # and mark the entry as recently used
+            _conditional_cache[cache_key] = _conditional_cache.pop(cache_key, cached)
+            return cached[1]
         response.raise_for_status()
         data = response.json()
         
         # Debug: Check if API returned an error
         if "error" in data:
-            print(f"⚠️  Open-Meteo API error: {data.get('reason', 'Unknown error')}. Using fallback data.")
+            logger.warning("Open-Meteo API error: %s. Using fallback data.", data.get('reason', 'Unknown error'))
             return get_fallback_forecast(start_date_str, end_date_str, days)
         
         # Parse the forecast data
@@ -71,27 +112,32 @@ def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
         sunrise = daily.get("sunrise", [])
         sunset = daily.get("sunset", [])
         
-        # Build forecast list
+        # Build forecast list - walk all columns in one zip pass instead of
+        # re-checking indices against every list on each field access
+        rows = zip_longest(
+            dates, temp_max, temp_min, precipitation,
+            weathercodes, windspeed, sunrise, sunset,
+        )
         forecast = []
-        for i in range(len(dates)):
-            # Convert weather code to description
-            weather_desc = get_weather_description(weathercodes[i] if i < len(weathercodes) else 0)
-            
+        for i, (date, t_max, t_min, precip, code, wind, rise, sset) in enumerate(
+            islice(rows, len(dates))
+        ):
+            code = 0 if code is None else code
             forecast.append({
                 "day": i + 1,
-                "date": dates[i],
-                "temp_max": round(temp_max[i], 1) if i < len(temp_max) else None,
-                "temp_min": round(temp_min[i], 1) if i < len(temp_min) else None,
-                "temp_avg": round((temp_max[i] + temp_min[i]) / 2, 1) if i < len(temp_max) and i < len(temp_min) else None,
-                "precipitation": round(precipitation[i], 1) if i < len(precipitation) else 0,
-                "weather": weather_desc,
-                "weathercode": weathercodes[i] if i < len(weathercodes) else 0,
-                "windspeed": round(windspeed[i], 1) if i < len(windspeed) else None,
-                "sunrise": sunrise[i].split("T")[1] if i < len(sunrise) else None,
-                "sunset": sunset[i].split("T")[1] if i < len(sunset) else None,
+                "date": date,
+                "temp_max": round(t_max, 1) if t_max is not None else None,
+                "temp_min": round(t_min, 1) if t_min is not None else None,
+                "temp_avg": round((t_max + t_min) / 2, 1) if t_max is not None and t_min is not None else None,
+                "precipitation": round(precip, 1) if precip is not None else 0,
+                "weather": get_weather_description(code),
+                "weathercode": code,
+                "windspeed": round(wind, 1) if wind is not None else None,
+                "sunrise": rise.split("T")[1] if rise is not None else None,
+                "sunset": sset.split("T")[1] if sset is not None else None,
             })
         
-        return {
+        result = {
             "location": "Cox's Bazar, Bangladesh",
             "coordinates": {"latitude": COX_BAZAR_LAT, "longitude": COX_BAZAR_LON},
             "start_date": start_date_str,
@@ -100,50 +146,69 @@ def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
             "timezone": "Asia/Dhaka",
             "forecast": forecast
         }
-        
+
+        etag = response.headers.get("etag")
+        if isinstance(etag, str) and etag:
+            _conditional_cache.pop(cache_key, None)
+            while len(_conditional_cache) >= _CONDITIONAL_CACHE_MAX_ENTRIES:
+                _conditional_cache.pop(next(iter(_conditional_cache)))
+            _conditional_cache[cache_key] = (etag, result)
+        return result
+
     except Exception as e:
         # Fallback to mock data if API fails
-        print(f"⚠️  Open-Meteo API error: {e}. Using fallback data.")
+        logger.warning("Open-Meteo API error: %s. Using fallback data.", e)
         return get_fallback_forecast(start_date_str, end_date_str, days)
 
 
+# WMO weather code descriptions, built once at module load
+_WEATHER_CODES = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+
+# Dense description table - WMO codes are 0-99, so a 100-slot list gives
+# O(1) index lookup without hashing
+_WEATHER_DESCRIPTIONS = ["Unknown"] * 100
+for _code, _description in _WEATHER_CODES.items():
+    _WEATHER_DESCRIPTIONS[_code] = _description
+
+
 def get_weather_description(weathercode: int) -> str:
     """
     Convert WMO weather code to human-readable description.
-    
+
     Args:
         weathercode: WMO weather code
-    
+
     Returns:
         Human-readable weather description
     """
-    weather_codes = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Foggy",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        71: "Slight snow",
-        73: "Moderate snow",
-        75: "Heavy snow",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail"
-    }
-    return weather_codes.get(weathercode, "Unknown")
+    if 0 <= weathercode <= 99:
+        return _WEATHER_DESCRIPTIONS[weathercode]
+    return "Unknown"
 
 
 def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str, Any]:
@@ -160,19 +225,21 @@ def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str
     """
     forecast = []
     base_temp = 28
-    
-    # Parse start date to generate proper dates for each day
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    
+
+    # Parse start date to generate proper dates for each day; the input is
+    # always YYYY-MM-DD here, so the C-level fromisoformat/isoformat pair
+    # replaces the strptime/strftime format machinery
+    start_dt = date.fromisoformat(start_date)
+
     for i in range(days):
         current_date = start_dt + timedelta(days=i)
         temp_variation = (i % 3) - 1  # Creates variation: -1, 0, 1
         temp_max = base_temp + 2 + temp_variation
         temp_min = base_temp - 3 + temp_variation
-        
+
         forecast.append({
             "day": i + 1,
-            "date": current_date.strftime("%Y-%m-%d"),
+            "date": current_date.isoformat(),
             "temp_max": temp_max,
             "temp_min": temp_min,
             "temp_avg": round((temp_max + temp_min) / 2, 1),
@@ -196,59 +263,82 @@ def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str
     }
 
 
-def get_activity_suggestions(temperature: float, time_of_day: str = "afternoon") -> List[str]:
+# Activity suggestions precomputed per (time of day, temperature bucket)
+# so lookups don't rebuild the lists on every call.
+_MORNING_COOL_ACTIVITIES = (
+    "Beach walk and photography",
+    "Visit Himchari National Park",
+    "Sunrise at Laboni Beach",
+    "Morning yoga on the beach",
+)
+_MORNING_WARM_ACTIVITIES = (
+    "Early morning swim",
+    "Sunrise boat ride",
+    "Visit Inani Beach",
+    "Morning market exploration",
+)
+_AFTERNOON_COOL_ACTIVITIES = (
+    "Visit Aggameda Khyang monastery",
+    "Explore Ramu Buddhist Village",
+    "Maheshkhali Island tour",
+    "Marine Drive scenic route",
+)
+_AFTERNOON_HOT_ACTIVITIES = (
+    "Indoor activities - shopping at local markets",
+    "Visit Bangabandhu Safari Park",
+    "Relax at beach resorts",
+    "Water sports activities",
+)
+_EVENING_ACTIVITIES = (
+    "Sunset at Sugandha Beach",
+    "Seafood dinner at local restaurants",
+    "Beach bonfire",
+    "Night market shopping",
+    "Cultural performances",
+)
+
+# time_of_day -> (cool threshold in °C, below-threshold set, at/above set).
+# Evenings ignore temperature, so both slots share one set.
+_ACTIVITY_TABLE = {
+    "morning": (28, _MORNING_COOL_ACTIVITIES, _MORNING_WARM_ACTIVITIES),
+    "afternoon": (30, _AFTERNOON_COOL_ACTIVITIES, _AFTERNOON_HOT_ACTIVITIES),
+    "evening": (0, _EVENING_ACTIVITIES, _EVENING_ACTIVITIES),
+}
+
+
+def get_activity_suggestions(temperature: float, time_of_day: str = "afternoon") -> Tuple[str, ...]:
     """
     Suggest activities based on temperature and time of day.
-    
+
     Args:
         temperature: Temperature in Celsius
         time_of_day: "morning", "afternoon", or "evening"
-    
+
     Returns:
-        List of suggested activities
+        Tuple of suggested activities (shared, immutable - do not mutate)
     """
-    suggestions = []
-    
-    if time_of_day == "morning":
-        if temperature < 28:
-            suggestions = [
-                "Beach walk and photography",
-                "Visit Himchari National Park",
-                "Sunrise at Laboni Beach",
-                "Morning yoga on the beach"
-            ]
-        else:
-            suggestions = [
-                "Early morning swim",
-                "Sunrise boat ride",
-                "Visit Inani Beach",
-                "Morning market exploration"
-            ]
-    
-    elif time_of_day == "afternoon":
-        if temperature < 30:
-            suggestions = [
-                "Visit Aggameda Khyang monastery",
-                "Explore Ramu Buddhist Village",
-                "Maheshkhali Island tour",
-                "Marine Drive scenic route"
-            ]
-        else:
-            suggestions = [
-                "Indoor activities - shopping at local markets",
-                "Visit Bangabandhu Safari Park",
-                "Relax at beach resorts",
-                "Water sports activities"
-            ]
-    
-    else:  # evening
-        suggestions = [
-            "Sunset at Sugandha Beach",
-            "Seafood dinner at local restaurants",
-            "Beach bonfire",
-            "Night market shopping",
-            "Cultural performances"
-        ]
-    
-    return suggestions
+    # Unknown times of day fall back to the evening set, matching the
+    # original if/else chain
+    threshold, cool, warm = _ACTIVITY_TABLE.get(time_of_day, _ACTIVITY_TABLE["evening"])
+    return cool if temperature < threshold else warm
+
+
+def get_daily_activity_suggestions(temp_avg: float) -> tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Get morning, afternoon and evening suggestions for a day in one call.
+
+    Mornings are judged a couple of degrees cooler than the daily average,
+    matching how the itinerary formatter picked activities per time slot.
+
+    Args:
+        temp_avg: Average temperature for the day in Celsius
+
+    Returns:
+        Tuple of (morning, afternoon, evening) suggestion tuples
+    """
+    return (
+        get_activity_suggestions(temp_avg - 2, "morning"),
+        get_activity_suggestions(temp_avg, "afternoon"),
+        get_activity_suggestions(temp_avg, "evening"),
+    )
 
@@ -1,16 +1,19 @@
 """Helper utility functions."""
 from datetime import datetime
-from dateutil import parser
 from fastmcp.server.auth import AuthContext
+from mcp_server.utils.get_weather_forecast import parse_start_date
 from fastmcp.server.dependencies import (
     get_http_request, get_http_headers, get_context
 )
 import os
 from dotenv import load_dotenv
-import requests
+from mcp_server.lib.httpx_client import HttpxClient
 
 load_dotenv()
 
+# Shared client for auth provider lookups, reusing one connection pool
+auth_http_client = HttpxClient(mode="sync")
+
 def format_date(date_str: str) -> str:
     """
     Format date string to standard format.
@@ -22,11 +25,7 @@ def format_date(date_str: str) -> str:
         Formatted date string (DD MMM YYYY)
     """
     try:
-        if date_str.lower() == "today":
-            dt = datetime.today()
-        else:
-            dt = parser.parse(date_str)
-        return dt.strftime("%d %b %Y")
+        return parse_start_date(date_str).strftime("%d %b %Y")
     except Exception:
         return datetime.today().strftime("%d %b %Y")
 
@@ -112,6 +111,6 @@ def get_auth0_user_info(token: str) -> dict:
     auth0_domain = os.getenv("AUTH0_DOMAIN")
     url = f"https://{auth0_domain}/userinfo"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = auth_http_client.get(url, headers=headers)
     response.raise_for_status()
     return response.json()
\ No newline at end of file
@@ -1,7 +1,8 @@
 from mcp_server.lib.httpx_client import HttpxClient
 
+# Shared async client so all forecast fetches reuse one connection pool
 open_meteo_client = HttpxClient(
     base_url="https://api.open-meteo.com",
-    mode="sync",
+    mode="async",
 )
 
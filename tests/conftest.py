@@ -4,15 +4,45 @@ This file imports all fixtures from the fixtures/ directory to make them
 available to all tests. Additional pytest configuration and hooks can be
 added here as needed.
 """
+import pytest
+
 # Import all fixtures to make them available to tests
 from tests.fixtures import (
     mock_context,
     sample_weather_data,
     mock_open_meteo_response,
+    _sample_weather_data_base,
+    _mock_open_meteo_response_base,
 )
 
 __all__ = [
     "mock_context",
     "sample_weather_data",
     "mock_open_meteo_response",
+    "_sample_weather_data_base",
+    "_mock_open_meteo_response_base",
 ]
+
+
+@pytest.fixture(autouse=True)
+def _isolate_shared_caches():
+    """Reset module-level caches around every test.
+
+    The forecast TTL cache, its in-flight futures map and the ETag cache
+    are process-wide. Clearing them per test removes any dependence on
+    execution order, so the suite stays correct when split across
+    pytest-xdist workers or reordered.
+
+    Imported here rather than at module top so bare collection
+    (pytest --collect-only of conftest) does not pull in the server
+    package before any test actually runs.
+    """
+    from mcp_server.utils import forecast_cache, get_weather_forecast
+
+    forecast_cache._forecast_cache.clear()
+    forecast_cache._inflight.clear()
+    get_weather_forecast._conditional_cache.clear()
+    yield
+    forecast_cache._forecast_cache.clear()
+    forecast_cache._inflight.clear()
+    get_weather_forecast._conditional_cache.clear()
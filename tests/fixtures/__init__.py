@@ -1,10 +1,17 @@
 """Shared test fixtures."""
 from .context import mock_context
-from .weather import sample_weather_data, mock_open_meteo_response
+from .weather import (
+    sample_weather_data,
+    mock_open_meteo_response,
+    _sample_weather_data_base,
+    _mock_open_meteo_response_base,
+)
 
 __all__ = [
     "mock_context",
     "sample_weather_data",
     "mock_open_meteo_response",
+    "_sample_weather_data_base",
+    "_mock_open_meteo_response_base",
 ]
 
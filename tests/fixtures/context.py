@@ -1,24 +1,36 @@
 """MCP Context fixtures for testing."""
 import pytest
-from unittest.mock import Mock, AsyncMock
-from fastmcp import Context
+from unittest.mock import AsyncMock
+
+
+class MockContext:
+    """Lightweight stand-in for an MCP Context.
+
+    Only the methods the handlers actually call are provided, each as an
+    AsyncMock so tests keep the familiar call-assertion API. Skipping
+    ``Mock(spec=Context)`` avoids introspecting the full Context class
+    on every test.
+    """
+
+    __slots__ = ("read_resource", "info", "error", "elicit")
+
+    def __init__(self):
+        self.read_resource = AsyncMock()
+        self.info = AsyncMock()
+        self.error = AsyncMock()
+        self.elicit = AsyncMock()
 
 
 @pytest.fixture
 def mock_context():
     """Create a mock MCP Context for testing.
-    
+
     Returns:
-        Mock: A mocked Context with async methods for testing MCP tools and resources.
-        
+        MockContext: A lightweight context exposing async read_resource,
+        info, error and elicit mocks for testing MCP tools and resources.
+
     Example:
         >>> def test_my_tool(mock_context):
         ...     mock_context.info.assert_called_once()
     """
-    ctx = Mock(spec=Context)
-    ctx.read_resource = AsyncMock()
-    ctx.info = AsyncMock()
-    ctx.error = AsyncMock()
-    ctx.elicit = AsyncMock()
-    return ctx
-
+    return MockContext()
@@ -1,9 +1,37 @@
 """Unit tests for elicitation utilities."""
 import pytest
-from unittest.mock import AsyncMock, Mock
+from types import SimpleNamespace
 from mcp_server.utils.elicitation import elicit_trip_extension
 from mcp_server.models.itinerary_models import ItineraryPreferences
 
+# Canonical (start_date, current_days) for the below-minimum trip most
+# tests exercise; unpacked at each call site.
+_ELICIT_ARGS = ("2025-01-15", 1)
+
+
+@pytest.fixture(scope="module")
+def elicit_result_factory():
+    """Factory for elicitation result objects.
+
+    Results are plain SimpleNamespace bags carrying a real
+    ItineraryPreferences built via model_construct - no Mock machinery,
+    no validation pass, and the same shape the server hands back.
+
+    Returns:
+        function: make(action, extend_trip, new_days) -> result object
+    """
+    def make(action="accept", extend_trip=True, new_days=3):
+        # Plain attribute bag - the code under test only reads .action
+        # and .data, so SimpleNamespace beats Mock's attribute machinery
+        return SimpleNamespace(
+            action=action,
+            data=ItineraryPreferences.model_construct(
+                extendTrip=extend_trip, newDays=new_days
+            ),
+        )
+
+    return make
+
 
 @pytest.mark.unit
 class TestElicitTripExtension:
@@ -21,19 +49,16 @@ class TestElicitTripExtension:
         mock_context.elicit.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_elicitation_accepted_with_extension(self, mock_context):
+    async def test_elicitation_accepted_with_extension(
+        self, mock_context, elicit_result_factory
+    ):
         """Test successful trip extension via elicitation."""
-        # Mock elicitation response
-        mock_result = Mock()
-        mock_result.action = "accept"
-        mock_result.data = Mock(spec=ItineraryPreferences)
-        mock_result.data.extendTrip = True
-        mock_result.data.newDays = 3
-        
-        mock_context.elicit.return_value = mock_result
+        mock_context.elicit.return_value = elicit_result_factory(
+            extend_trip=True, new_days=3
+        )
         
         days, note = await elicit_trip_extension(
-            mock_context, "2025-01-15", 1, min_days=2
+            mock_context, *_ELICIT_ARGS, min_days=2
         )
         
         assert days == 3
@@ -42,18 +67,16 @@ class TestElicitTripExtension:
         mock_context.info.assert_called()
     
     @pytest.mark.asyncio
-    async def test_elicitation_accepted_with_minimum_days(self, mock_context):
+    async def test_elicitation_accepted_with_minimum_days(
+        self, mock_context, elicit_result_factory
+    ):
         """Test that minimum days constraint is enforced."""
-        mock_result = Mock()
-        mock_result.action = "accept"
-        mock_result.data = Mock(spec=ItineraryPreferences)
-        mock_result.data.extendTrip = True
-        mock_result.data.newDays = 1  # Below minimum
-        
-        mock_context.elicit.return_value = mock_result
+        mock_context.elicit.return_value = elicit_result_factory(
+            extend_trip=True, new_days=1  # Below minimum
+        )
         
         days, note = await elicit_trip_extension(
-            mock_context, "2025-01-15", 1, min_days=2
+            mock_context, *_ELICIT_ARGS, min_days=2
         )
         
         # Should enforce minimum days
@@ -61,28 +84,20 @@ class TestElicitTripExtension:
         assert note == ""
     
     @pytest.mark.asyncio
-    async def test_elicitation_rejected(self, mock_context):
+    async def test_elicitation_rejected(self, mock_context, elicit_result_factory):
         """Test when user rejects trip extension."""
-        mock_result = Mock()
-        mock_result.action = "accept"
-        mock_result.data = Mock(spec=ItineraryPreferences)
-        mock_result.data.extendTrip = False
-        
-        mock_context.elicit.return_value = mock_result
+        mock_context.elicit.return_value = elicit_result_factory(extend_trip=False)
         
         with pytest.raises(ValueError, match="CANCELLED"):
-            await elicit_trip_extension(mock_context, "2025-01-15", 1, min_days=2)
+            await elicit_trip_extension(mock_context, *_ELICIT_ARGS, min_days=2)
     
     @pytest.mark.asyncio
-    async def test_elicitation_cancelled(self, mock_context):
+    async def test_elicitation_cancelled(self, mock_context, elicit_result_factory):
         """Test when user cancels elicitation dialog."""
-        mock_result = Mock()
-        mock_result.action = "cancel"
-        
-        mock_context.elicit.return_value = mock_result
+        mock_context.elicit.return_value = elicit_result_factory(action="cancel")
         
         with pytest.raises(ValueError, match="CANCELLED"):
-            await elicit_trip_extension(mock_context, "2025-01-15", 1, min_days=2)
+            await elicit_trip_extension(mock_context, *_ELICIT_ARGS, min_days=2)
     
     @pytest.mark.asyncio
     async def test_elicitation_not_supported(self, mock_context):
@@ -92,7 +107,7 @@ class TestElicitTripExtension:
         )
         
         days, note = await elicit_trip_extension(
-            mock_context, "2025-01-15", 1, min_days=2
+            mock_context, *_ELICIT_ARGS, min_days=2
         )
         
         assert days == 1
@@ -106,7 +121,7 @@ class TestElicitTripExtension:
         mock_context.elicit.side_effect = AttributeError("No elicit method")
         
         days, note = await elicit_trip_extension(
-            mock_context, "2025-01-15", 1, min_days=2
+            mock_context, *_ELICIT_ARGS, min_days=2
         )
         
         assert days == 1
@@ -118,7 +133,7 @@ class TestElicitTripExtension:
         mock_context.elicit.side_effect = Exception("Unexpected error")
         
         days, note = await elicit_trip_extension(
-            mock_context, "2025-01-15", 1, min_days=2
+            mock_context, *_ELICIT_ARGS, min_days=2
         )
         
         assert days == 1
@@ -130,5 +145,5 @@ class TestElicitTripExtension:
         mock_context.elicit.side_effect = ValueError("User cancelled")
         
         with pytest.raises(ValueError):
-            await elicit_trip_extension(mock_context, "2025-01-15", 1, min_days=2)
+            await elicit_trip_extension(mock_context, *_ELICIT_ARGS, min_days=2)
 
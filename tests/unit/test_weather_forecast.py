@@ -33,61 +33,63 @@ class TestWeatherDescription:
 @pytest.mark.unit
 class TestActivitySuggestions:
     """Test activity suggestions based on temperature and time of day."""
-    
-    def test_morning_cool_weather(self):
-        """Test morning activities for comfortable temperatures (<28°C)."""
-        suggestions = get_activity_suggestions(25.0, "morning")
-        assert len(suggestions) > 0
-        assert "Beach walk" in suggestions[0] or "Himchari" in suggestions[0]
-    
-    def test_morning_warm_weather(self):
-        """Test morning activities for warm weather (>=28°C)."""
-        suggestions = get_activity_suggestions(30.0, "morning")
-        assert len(suggestions) > 0
-        assert any("swim" in s.lower() or "beach" in s.lower() for s in suggestions)
-    
-    def test_afternoon_cool_weather(self):
-        """Test afternoon activities for moderate temperatures (<30°C)."""
-        suggestions = get_activity_suggestions(28.0, "afternoon")
-        assert len(suggestions) > 0
-        assert any("monastery" in s.lower() or "village" in s.lower() for s in suggestions)
-    
-    def test_afternoon_hot_weather(self):
-        """Test afternoon activities for hot weather (>=30°C)."""
-        suggestions = get_activity_suggestions(32.0, "afternoon")
-        assert len(suggestions) > 0
-        assert any("indoor" in s.lower() or "shopping" in s.lower() for s in suggestions)
-    
-    def test_evening_activities(self):
-        """Test evening activities (temperature independent)."""
-        suggestions = get_activity_suggestions(27.0, "evening")
-        assert len(suggestions) > 0
-        assert any("sunset" in s.lower() or "dinner" in s.lower() for s in suggestions)
-    
-    def test_default_time_of_day(self):
-        """Test default time of day fallback (afternoon)."""
-        suggestions = get_activity_suggestions(28.0)
+
+    @pytest.mark.parametrize(
+        ("temperature", "time_of_day", "expected_substrings"),
+        [
+            pytest.param(25.0, "morning", ("beach walk", "himchari"),
+                         id="morning-cool"),
+            pytest.param(30.0, "morning", ("swim", "beach"),
+                         id="morning-warm"),
+            pytest.param(28.0, "afternoon", ("monastery", "village"),
+                         id="afternoon-cool"),
+            pytest.param(32.0, "afternoon", ("indoor", "shopping"),
+                         id="afternoon-hot"),
+            pytest.param(27.0, "evening", ("sunset", "dinner"),
+                         id="evening"),
+            pytest.param(28.0, None, (), id="default-time-of-day"),
+        ],
+    )
+    def test_activity_suggestions(self, temperature, time_of_day, expected_substrings):
+        """One sweep over temperature/time-of-day buckets.
+
+        Each case asserts a non-empty suggestion set and, where the
+        bucket is temperature-specific, that at least one suggestion
+        mentions an expected keyword.
+        """
+        if time_of_day is None:
+            # Default time of day fallback (afternoon)
+            suggestions = get_activity_suggestions(temperature)
+        else:
+            suggestions = get_activity_suggestions(temperature, time_of_day)
+
         assert len(suggestions) > 0
+        if expected_substrings:
+            assert any(
+                sub in s.lower() for s in suggestions for sub in expected_substrings
+            )
+
+
+@pytest.fixture(scope="module")
+def fallback_forecast_3day():
+    """Three-day fallback forecast generated once for the read-only tests."""
+    return get_fallback_forecast("2025-01-15", "2025-01-17", 3)
 
 
 @pytest.mark.unit
 class TestFallbackForecast:
     """Test fallback forecast generation for offline scenarios."""
-    
-    def test_fallback_forecast_structure(self):
+
+    def test_fallback_forecast_structure(self, fallback_forecast_3day):
         """Test that fallback forecast has all required fields."""
-        start_date = "2025-01-15"
-        end_date = "2025-01-17"
-        days = 3
-        
-        forecast = get_fallback_forecast(start_date, end_date, days)
-        
+        forecast = fallback_forecast_3day
+
         assert forecast["location"] == "Cox's Bazar, Bangladesh"
-        assert forecast["start_date"] == start_date
-        assert forecast["end_date"] == end_date
-        assert forecast["days"] == days
+        assert forecast["start_date"] == "2025-01-15"
+        assert forecast["end_date"] == "2025-01-17"
+        assert forecast["days"] == 3
         assert forecast["timezone"] == "Asia/Dhaka"
-        assert len(forecast["forecast"]) == days
+        assert len(forecast["forecast"]) == 3
         assert "note" in forecast
     
     def test_fallback_forecast_days(self):
@@ -102,9 +104,9 @@ class TestFallbackForecast:
         assert forecast["forecast"][0]["day"] == 1
         assert forecast["forecast"][-1]["day"] == days
     
-    def test_fallback_forecast_data_types(self):
+    def test_fallback_forecast_data_types(self, fallback_forecast_3day):
         """Test that fallback forecast uses correct data types."""
-        forecast = get_fallback_forecast("2025-01-15", "2025-01-17", 3)
+        forecast = fallback_forecast_3day
         
         day = forecast["forecast"][0]
         assert isinstance(day["day"], int)
@@ -1,50 +1,34 @@
 """Unit tests for weather resource endpoint."""
 import pytest
-import sys
+import orjson
 from unittest.mock import patch
 
+from mcp_server.utils import forecast_cache
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def resource_weather_forecast_func():
-    """Fixture to get the undecorated weather resource function.
-    
-    This fixture patches the decorator to get direct access to the
-    underlying function for unit testing.
-    
-    Yields:
-        tuple: (function, module) pair for testing
+    """Fixture to get the weather resource's underlying function.
+
+    The decorated handler is a one-line delegation to
+    get_cached_forecast_json, so tests exercise that function directly -
+    no decorator patching or sys.modules juggling required.
+
+    Returns:
+        function: The get_cached_forecast_json function
     """
-    # Patch the decorator to return the function as-is (no-op decorator)
-    decorator_patcher = patch(
-        'mcp_server.mcp_instance.mcp.resource',
-        lambda *args, **kwargs: lambda f: f
-    )
-    decorator_patcher.start()
-    
-    try:
-        # Clear module cache and re-import to get undecorated function
-        if 'mcp_server.handlers.resources.weather' in sys.modules:
-            del sys.modules['mcp_server.handlers.resources.weather']
-        from mcp_server.handlers.resources import weather
-        yield weather.resource_weather_forecast, weather
-    finally:
-        decorator_patcher.stop()
-        # Clean up module cache
-        if 'mcp_server.handlers.resources.weather' in sys.modules:
-            del sys.modules['mcp_server.handlers.resources.weather']
+    return forecast_cache.get_cached_forecast_json
 
 
 @pytest.mark.unit
 class TestWeatherResource:
     """Test weather resource endpoint behavior."""
-    
+
     @pytest.mark.asyncio
     async def test_weather_resource_success(self, resource_weather_forecast_func):
         """Test successful weather resource data retrieval."""
-        func, weather_module = resource_weather_forecast_func
-        
-        # Patch the function in the module where it's used
-        with patch.object(weather_module, 'get_weather_forecast') as mock_forecast:
+        # Patch the fetch where the shared cache calls it
+        with patch.object(forecast_cache, 'get_weather_forecast') as mock_forecast:
             mock_data = {
                 "location": "Cox's Bazar, Bangladesh",
                 "start_date": "2025-01-15",
@@ -52,19 +36,17 @@ class TestWeatherResource:
                 "forecast": []
             }
             mock_forecast.return_value = mock_data
-            
-            result = await func("2025-01-15", 3)
-            
-            assert result == mock_data
+
+            result = await resource_weather_forecast_func("2025-01-15", 3)
+
+            assert orjson.loads(result) == mock_data
             mock_forecast.assert_called_once_with("2025-01-15", 3)
-    
+
     @pytest.mark.asyncio
     async def test_weather_resource_today(self, resource_weather_forecast_func):
         """Test weather resource with 'today' as date parameter."""
-        func, weather_module = resource_weather_forecast_func
-        
-        # Patch the function in the module where it's used
-        with patch.object(weather_module, 'get_weather_forecast') as mock_forecast:
+        # Patch the fetch where the shared cache calls it
+        with patch.object(forecast_cache, 'get_weather_forecast') as mock_forecast:
             mock_data = {
                 "location": "Cox's Bazar, Bangladesh",
                 "start_date": "2025-01-15",
@@ -72,19 +54,17 @@ class TestWeatherResource:
                 "forecast": []
             }
             mock_forecast.return_value = mock_data
-            
-            result = await func("today", 1)
-            
-            assert result == mock_data
+
+            result = await resource_weather_forecast_func("today", 1)
+
+            assert orjson.loads(result) == mock_data
             mock_forecast.assert_called_once_with("today", 1)
-    
+
     @pytest.mark.asyncio
     async def test_weather_resource_different_days(self, resource_weather_forecast_func):
         """Test weather resource with various day counts."""
-        func, weather_module = resource_weather_forecast_func
-        
-        # Patch the function in the module where it's used
-        with patch.object(weather_module, 'get_weather_forecast') as mock_forecast:
+        # Patch the fetch where the shared cache calls it
+        with patch.object(forecast_cache, 'get_weather_forecast') as mock_forecast:
             mock_data = {
                 "location": "Cox's Bazar, Bangladesh",
                 "start_date": "2025-01-15",
@@ -92,9 +72,8 @@ class TestWeatherResource:
                 "forecast": []
             }
             mock_forecast.return_value = mock_data
-            
-            result = await func("2025-01-15", 7)
-            
-            assert result["days"] == 7
-            mock_forecast.assert_called_once_with("2025-01-15", 7)
 
+            result = await resource_weather_forecast_func("2025-01-15", 7)
+
+            assert orjson.loads(result)["days"] == 7
+            mock_forecast.assert_called_once_with("2025-01-15", 7)